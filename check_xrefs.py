@@ -8,15 +8,73 @@ It supports both xref: and <<>> syntax and checks against explicit and auto-gene
 
 import re
 import os
-from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Set, List, Tuple
+from typing import Any, FrozenSet, Iterator, Optional, List, Tuple
 import sys
-
-
-@dataclass
+from itertools import repeat
+from array import array
+
+
+# Sub-patterns for every token of interest. Each has exactly one named group,
+# so match.lastgroup tells which kind of token matched.
+# [[id]] or [[id,title]] syntax (standalone or inline)
+BRACKET_ID = rb'\[\[(?P<bracket>[^\]]+)\]\]'
+# [#id] syntax (standalone or inline)
+HASH_ID = rb'\[#(?P<hash>[^\]]+)\]'
+# Section headers (=, ==, ===, etc.). Anchored on the preceding newline rather
+# than ^ so that every alternative starts with a literal character, which lets
+# the regex engine skip straight to candidate positions instead of trying each
+# alternative at every offset. A header on the first line is matched separately.
+# On a bytes pattern \s is ASCII whitespace only, so a marker followed by a
+# Unicode space such as U+00A0 or U+2003 is not a section header.
+SECTION_HEADER = rb'\n=+\s+(?P<header>.+)$'
+# xref:id[...] syntax. The link text is matched so that, as with a separate xref
+# scan, no xref is found inside it; other tokens in it are found by rescanning.
+XREF = rb'xref:(?P<xref>[a-zA-Z0-9_-]+)(?:\[[^\]\n]*\])?'
+# <<id>> or <<id,text>> syntax
+ANGLE_BRACKET_XREF = rb'<<(?P<angle_bracket>[a-zA-Z0-9_-]+)(?:,[^>\n]*)?>>'
+
+# All tokens combined, so each file is scanned in a single pass
+TOKEN_PATTERN = re.compile(
+    b'|'.join([BRACKET_ID, HASH_ID, SECTION_HEADER, XREF, ANGLE_BRACKET_XREF]),
+    re.MULTILINE
+)
+
+FIRST_SECTION_HEADER_PATTERN = re.compile(rb'=+\s+(?P<header>.+)$', re.MULTILINE)
+
+# The start of any token, to find tokens nested inside another
+NESTED_TOKEN_START_PATTERN = re.compile(rb'\[\[|\[#|\n=|xref:|<<')
+
+# Patterns for turning section header text into its auto-generated ID
+# Anything the cleanup patterns below can remove, combined so it is found in one pass
+HEADER_MARKUP_PATTERN = re.compile(r'\[\[|\[#|\*|_|`|https?://|link:')
+INLINE_BRACKET_ID_PATTERN = re.compile(r'\[\[[^\]]+\]\]')
+INLINE_HASH_ID_PATTERN = re.compile(r'\[#[^\]]+\]')
+BOLD_PATTERN = re.compile(r'\*\*?([^*]+)\*\*?')
+ITALIC_PATTERN = re.compile(r'__?([^_]+)__?')
+MONOSPACE_PATTERN = re.compile(r'`([^`]+)`')
+URL_PATTERN = re.compile(r'https?://[^\s\[]+')
+LINK_MACRO_PATTERN = re.compile(r'link:[^\[]+\[[^\]]*\]')
+NON_ID_CHAR_PATTERN = re.compile(r'[^\w\s-]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+HYPHENS_PATTERN = re.compile(r'-+')
+
+# Byte translation for normalizing ASCII header text in one pass: whitespace
+# becomes a hyphen, and everything outside [\w\s-] is deleted. Built from the
+# same character classes re uses for \s and \w on str patterns.
+ASCII_ID_TABLE = bytes(ord('-') if chr(c).isspace() else c for c in range(256))
+ASCII_NON_ID_CHARS = bytes(
+    c for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '_-')
+)
+
+# Number of files analyzed per worker task, to amortize pickling and IPC overhead
+BATCH_SIZE = 64
+
+
+@dataclass(slots=True)
 class XRefInfo:
     """Information about a cross-reference"""
     file_path: str
@@ -25,15 +83,26 @@ class XRefInfo:
     xref_type: str  # 'xref' or 'angle_bracket'
 
 
-@dataclass
+@dataclass(slots=True)
 class FileAnalysis:
     """Analysis results for a single file"""
     file_path: str
-    section_ids: Set[str]
+    section_ids: List[str]  # may contain duplicates, which are merged when aggregating
     xrefs: List[XRefInfo]
     errors: List[str]
 
 
+@dataclass(slots=True)
+class BatchAnalysis:
+    """Column-oriented analysis results for a batch of files, indexed by position in the batch"""
+    section_ids: List[str]
+    section_files: array  # batch index of the file defining each section ID
+    xref_ids: List[str]  # distinct IDs referenced by each file
+    xref_files: array  # batch index of the file referencing each xref ID
+    xref_count: int
+    errors: List[str]
+
+
 def normalize_id(text: str) -> str:
     """
     Normalize a section header to an auto-generated ID.
@@ -41,121 +110,150 @@ def normalize_id(text: str) -> str:
     """
     # Convert to lowercase
     text = text.lower()
+
+    if text.isascii():
+        # Fast path: delete special chars and turn whitespace into hyphens with a
+        # single translate, then collapse and trim hyphens with split and join
+        id_bytes = text.encode('ascii').translate(ASCII_ID_TABLE, ASCII_NON_ID_CHARS)
+        return '-'.join(filter(None, id_bytes.decode('ascii').split('-')))
+
     # Remove formatting and special chars, replace spaces with hyphens
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'\s+', '-', text)
+    text = NON_ID_CHAR_PATTERN.sub('', text)
+    text = WHITESPACE_PATTERN.sub('-', text)
     # Remove multiple consecutive hyphens
-    text = re.sub(r'-+', '-', text)
+    text = HYPHENS_PATTERN.sub('-', text)
     # Remove leading/trailing hyphens
     text = text.strip('-')
     return text
 
 
-def extract_section_ids(content: str, lines: List[str]) -> Set[str]:
+def header_to_id(header_text: str) -> str:
+    """
+    Convert section header text to its auto-generated ID.
     """
-    Extract all section IDs from file content.
-    Supports:
+    # Most headers are plain text, so check for markup in a single pass
+    # before running the cleanup substitutions one by one
+    if HEADER_MARKUP_PATTERN.search(header_text) is None:
+        return normalize_id(header_text)
+
+    # Remove inline IDs like [[id]] or [#id] from the header text before auto-generating ID
+    header_text = INLINE_BRACKET_ID_PATTERN.sub('', header_text)
+    header_text = INLINE_HASH_ID_PATTERN.sub('', header_text)
+    # Remove inline formatting like *bold*, _italic_, etc.
+    header_text = BOLD_PATTERN.sub(r'\1', header_text)
+    header_text = ITALIC_PATTERN.sub(r'\1', header_text)
+    header_text = MONOSPACE_PATTERN.sub(r'\1', header_text)
+    # Remove links
+    header_text = URL_PATTERN.sub('', header_text)
+    header_text = LINK_MACRO_PATTERN.sub('', header_text)
+
+    return normalize_id(header_text)
+
+
+def iter_tokens(content: bytes) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (kind, match) for every token in content, in file order.
+    The combined pattern matches each offset at most once, but tokens can sit
+    inside one another: an xref in a header title, in a multi-line [#id] or in
+    the text of <<id,text>>, or a header inside a multi-line [[id]]. So when a
+    token's text holds the start of another, scanning resumes there instead of
+    after the token. A token is yielded only if it starts after the last one of
+    its kind ends, which gives the same tokens as a separate scan for each kind.
+    """
+    # End offset of the last token yielded of each kind
+    kind_ends = defaultdict(int)
+
+    pos = 0
+    first_header = FIRST_SECTION_HEADER_PATTERN.match(content)
+    if first_header:
+        yield 'header', first_header
+        kind_ends['header'] = first_header.end()
+        nested = NESTED_TOKEN_START_PATTERN.search(content, first_header.start() + 1, first_header.end())
+        pos = nested.start() if nested else first_header.end()
+
+    while pos is not None:
+        resume = None
+        for match in TOKEN_PATTERN.finditer(content, pos):
+            kind = match.lastgroup
+            if match.start() >= kind_ends[kind]:
+                kind_ends[kind] = match.end()
+                yield kind, match
+            # Most tokens hold no others, which a search of just their text rules
+            # out. The search starts right after the token's first character, since
+            # a token can also start inside another's markup, as [#x] in [[#x]].
+            nested = NESTED_TOKEN_START_PATTERN.search(content, match.start() + 1, match.end())
+            if nested:
+                resume = nested.start()
+                break
+        pos = resume
+
+
+def extract_ids_and_xrefs(content: bytes, file_path: str) -> Tuple[List[str], List[XRefInfo]]:
+    """
+    Extract all section IDs and cross-references from file content in a single pass.
+    All patterns are ASCII, so the raw bytes are scanned and only matched tokens are decoded.
+    Section IDs:
     - [[id]] syntax (standalone or inline)
     - [#id] syntax (standalone or inline)
     - Auto-generated IDs from section headers
-    """
-    section_ids = set()
-
-    # Pattern for explicit [[id]] or [[id,title]] syntax (standalone or inline)
-    # This pattern works for both "[[id]]" on its own line and "=== Title [[id]]" inline
-    explicit_bracket_pattern = re.compile(r'\[\[([^\]]+)\]\]')
-    for match in explicit_bracket_pattern.finditer(content):
-        # Handle [[id,title]] syntax - ID is the part before the comma
-        id_text = match.group(1)
-        section_id = id_text.split(',')[0].strip()
-        section_ids.add(section_id)
-
-    # Pattern for [#id] syntax (standalone or inline)
-    explicit_hash_pattern = re.compile(r'\[#([^\]]+)\]')
-    for match in explicit_hash_pattern.finditer(content):
-        section_id = match.group(1).split(',')[0].strip()
-        section_ids.add(section_id)
-
-    # Pattern for section headers (=, ==, ===, etc.)
-    # Auto-generate IDs from section titles
-    section_header_pattern = re.compile(r'^(=+)\s+(.+)$', re.MULTILINE)
-    for match in section_header_pattern.finditer(content):
-        header_text = match.group(2).strip()
-        # Remove inline IDs like [[id]] or [#id] from the header text before auto-generating ID
-        header_text = re.sub(r'\[\[[^\]]+\]\]', '', header_text)
-        header_text = re.sub(r'\[#[^\]]+\]', '', header_text)
-        # Remove inline formatting like *bold*, _italic_, etc.
-        header_text = re.sub(r'\*\*?([^*]+)\*\*?', r'\1', header_text)
-        header_text = re.sub(r'__?([^_]+)__?', r'\1', header_text)
-        header_text = re.sub(r'`([^`]+)`', r'\1', header_text)
-        # Remove links
-        header_text = re.sub(r'https?://[^\s\[]+', '', header_text)
-        header_text = re.sub(r'link:[^\[]+\[[^\]]*\]', '', header_text)
-
-        auto_id = normalize_id(header_text)
-        if auto_id:
-            section_ids.add(auto_id)
-
-    return section_ids
-
-
-def extract_xrefs(content: str, file_path: str) -> List[XRefInfo]:
-    """
-    Extract all cross-references from file content.
-    Supports:
+    Cross-references:
     - xref:id[...] syntax
     - <<id>> syntax
     - <<id,text>> syntax
     """
+    # IDs are interned, so each distinct ID is stored (and pickled) only once.
+    # Section IDs are collected in a list; repeats within a file are rare and
+    # are merged with all other definitions of the ID when aggregating.
+    section_ids = []
     xrefs = []
-    lines = content.split('\n')
-
-    # Pattern for xref:id[...] syntax
-    xref_pattern = re.compile(r'xref:([a-zA-Z0-9_-]+)(?:\[[^\]]*\])?')
-
-    # Pattern for <<id>> or <<id,text>> syntax
-    angle_bracket_pattern = re.compile(r'<<([a-zA-Z0-9_-]+)(?:,[^>]*)?>>')
 
-    for line_num, line in enumerate(lines, 1):
-        # Find xref: references
-        for match in xref_pattern.finditer(line):
-            xref_id = match.group(1)
+    # Line number of the last xref found. Tokens are matched in file order, so
+    # only the newlines since the previous xref need to be counted.
+    line_number = 1
+    line_offset = 0
+
+    for kind, token in iter_tokens(content):
+        if kind == 'header':
+            auto_id = header_to_id(token.group(kind).decode('utf-8', 'replace').strip())
+            if auto_id:
+                section_ids.append(sys.intern(auto_id))
+        elif kind in ('bracket', 'hash'):
+            # Handle [[id,title]] syntax - ID is the part before the comma
+            section_id = token.group(kind).decode('utf-8', 'replace').split(',')[0].strip()
+            section_ids.append(sys.intern(section_id))
+        elif kind in ('xref', 'angle_bracket'):
+            line_number += content.count(b'\n', line_offset, token.start())
+            line_offset = token.start()
             xrefs.append(XRefInfo(
                 file_path=file_path,
-                line_number=line_num,
-                xref_id=xref_id,
-                xref_type='xref'
+                line_number=line_number,
+                xref_id=sys.intern(token.group(kind).decode('ascii')),
+                xref_type=kind
             ))
 
-        # Find <<>> references
-        for match in angle_bracket_pattern.finditer(line):
-            xref_id = match.group(1)
-            xrefs.append(XRefInfo(
-                file_path=file_path,
-                line_number=line_num,
-                xref_id=xref_id,
-                xref_type='angle_bracket'
-            ))
+    return section_ids, xrefs
+
 
-    return xrefs
+def read_file(file_path: str) -> bytes:
+    """Read the raw content of a file for scanning."""
+    with open(file_path, 'rb') as f:
+        return f.read()
 
 
-def analyze_file(file_path: Path) -> FileAnalysis:
+def analyze_file(file_path: str, pending_read: Optional[Future] = None) -> FileAnalysis:
     """
     Analyze a single .adoc file for section IDs and cross-references.
+    If the file is already being read in the background, pending_read is the
+    Future that returns its content.
     """
     errors = []
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-
-        section_ids = extract_section_ids(content, lines)
-        xrefs = extract_xrefs(content, str(file_path))
+        content = pending_read.result() if pending_read else read_file(file_path)
+        section_ids, xrefs = extract_ids_and_xrefs(content, file_path)
 
         return FileAnalysis(
-            file_path=str(file_path),
+            file_path=file_path,
             section_ids=section_ids,
             xrefs=xrefs,
             errors=errors
@@ -164,17 +262,89 @@ def analyze_file(file_path: Path) -> FileAnalysis:
     except Exception as e:
         errors.append(f"Error reading {file_path}: {str(e)}")
         return FileAnalysis(
-            file_path=str(file_path),
-            section_ids=set(),
+            file_path=file_path,
+            section_ids=[],
             xrefs=[],
             errors=errors
         )
 
 
-def find_adoc_files(directory: str) -> List[Path]:
-    """Find all .adoc files in the directory recursively."""
-    path = Path(directory)
-    return list(path.rglob('*.adoc'))
+def analyze_file_batch(file_paths: List[str]) -> BatchAnalysis:
+    """
+    Analyze a batch of .adoc files in a single worker task.
+    Results are returned column by column, with files referred to by their
+    index in the batch, so little more than the IDs themselves is pickled
+    back to the main process. Only the distinct IDs each file references are
+    returned; the individual xrefs are only needed for IDs that turn out to
+    be missing, and are collected by analyze_broken_xrefs afterwards.
+    """
+    batch = BatchAnalysis(
+        section_ids=[],
+        section_files=array('I'),
+        xref_ids=[],
+        xref_files=array('I'),
+        xref_count=0,
+        errors=[]
+    )
+
+    # Read the files on a separate thread while they are scanned. File reads
+    # release the GIL, so disk I/O overlaps with scanning the previous file.
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        pending_reads = [reader.submit(read_file, file_path) for file_path in file_paths]
+
+        for file_index, (file_path, pending_read) in enumerate(zip(file_paths, pending_reads)):
+            result = analyze_file(file_path, pending_read)
+
+            batch.section_ids.extend(result.section_ids)
+            batch.section_files.extend(repeat(file_index, len(result.section_ids)))
+
+            xref_ids = {xref.xref_id for xref in result.xrefs}
+            batch.xref_ids.extend(xref_ids)
+            batch.xref_files.extend(repeat(file_index, len(xref_ids)))
+            batch.xref_count += len(result.xrefs)
+
+            batch.errors.extend(result.errors)
+
+    return batch
+
+
+def analyze_broken_xrefs(file_path: str, missing_ids: FrozenSet[str]) -> FileAnalysis:
+    """
+    Analyze a single .adoc file again, keeping only the xrefs to missing IDs.
+    """
+    result = analyze_file(file_path)
+    result.section_ids = []
+    result.xrefs = [xref for xref in result.xrefs if xref.xref_id in missing_ids]
+    return result
+
+
+def find_adoc_files(directory: str) -> List[str]:
+    """
+    Find all .adoc files in the directory recursively.
+    Walks the tree with os.scandir, which reuses the file type from the
+    directory listing instead of calling stat on every entry.
+    """
+    adoc_files = []
+    pending = [directory]
+
+    while pending:
+        # Like rglob, skip subdirectories that cannot be read
+        try:
+            entries = os.scandir(pending.pop())
+        except PermissionError:
+            continue
+
+        with entries:
+            for entry in entries:
+                # Like rglob, entries are matched by name alone, so broken symlinks
+                # are included and reported as read errors
+                if entry.name.endswith('.adoc'):
+                    adoc_files.append(entry.path)
+                # Symlinked directories are not descended into, as with rglob
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+
+    return adoc_files
 
 
 def main():
@@ -195,44 +365,74 @@ def main():
 
     # Analyze files in parallel
     all_section_ids = defaultdict(set)  # id -> set of files that define it
-    all_xrefs = []
+    referenced_ids = defaultdict(set)  # id -> set of files that reference it
+    xref_count = 0
+    broken_xrefs = []
     file_errors = []
 
     print("\nAnalyzing files in parallel...")
 
-    with ProcessPoolExecutor() as executor:
-        # Submit all files for analysis
-        future_to_file = {
-            executor.submit(analyze_file, file_path): file_path
-            for file_path in adoc_files
+    batches = [adoc_files[i:i + BATCH_SIZE] for i in range(0, len(adoc_files), BATCH_SIZE)]
+
+    # Worker processes only pay for their startup and pickling when there is
+    # more than one batch and more than one CPU; otherwise analyze in-process
+    max_workers = max(1, min(os.cpu_count() or 1, len(batches)))
+    executor_class = ProcessPoolExecutor if max_workers > 1 else ThreadPoolExecutor
+
+    with executor_class(max_workers=max_workers) as executor:
+        # Submit files for analysis in batches
+        future_to_batch = {
+            executor.submit(analyze_file_batch, batch): batch
+            for batch in batches
         }
 
         # Collect results as they complete
         completed = 0
-        for future in as_completed(future_to_file):
-            completed += 1
-            if completed % 50 == 0:
-                print(f"  Processed {completed}/{len(adoc_files)} files...")
+        for future in as_completed(future_to_batch):
+            batch = future_to_batch[future]
+            completed += len(batch)
+            print(f"  Processed {completed}/{len(adoc_files)} files...")
 
             try:
                 result = future.result()
 
-                # Collect section IDs
-                for section_id in result.section_ids:
-                    all_section_ids[section_id].add(result.file_path)
+                # Collect section IDs, interned again since unpickled strings are new objects
+                for section_id, file_index in zip(result.section_ids, result.section_files):
+                    all_section_ids[sys.intern(section_id)].add(batch[file_index])
 
-                # Collect xrefs
-                all_xrefs.extend(result.xrefs)
+                # Collect referenced IDs
+                for xref_id, file_index in zip(result.xref_ids, result.xref_files):
+                    referenced_ids[sys.intern(xref_id)].add(batch[file_index])
+                xref_count += result.xref_count
 
                 # Collect errors
-                if result.errors:
-                    file_errors.extend(result.errors)
+                file_errors.extend(result.errors)
 
             except Exception as e:
-                file_path = future_to_file[future]
-                file_errors.append(f"Error processing {file_path}: {str(e)}")
+                for file_path in batch:
+                    file_errors.append(f"Error processing {file_path}: {str(e)}")
+
+        print(f"  Processed {len(adoc_files)}/{len(adoc_files)} files")
+
+        # Find missing IDs with a single set difference, then collect the
+        # individual xrefs to them, only scanning the files that reference them
+        missing_ids = frozenset(referenced_ids.keys() - all_section_ids.keys())
+        files_to_rescan = sorted({file_path for xref_id in missing_ids for file_path in referenced_ids[xref_id]})
+
+        future_to_file = {
+            executor.submit(analyze_broken_xrefs, file_path, missing_ids): file_path
+            for file_path in files_to_rescan
+        }
+
+        for future in as_completed(future_to_file):
+            file_path = future_to_file[future]
+            try:
+                result = future.result()
+                broken_xrefs.extend(result.xrefs)
+                file_errors.extend(result.errors)
 
-    print(f"  Processed {len(adoc_files)}/{len(adoc_files)} files")
+            except Exception as e:
+                file_errors.append(f"Error processing {file_path}: {str(e)}")
 
     # Report file processing errors
     if file_errors:
@@ -247,12 +447,7 @@ def main():
     print("CHECKING CROSS-REFERENCES")
     print("="*80)
     print(f"Total section IDs found: {len(all_section_ids)}")
-    print(f"Total xrefs found: {len(all_xrefs)}")
-
-    broken_xrefs = []
-    for xref in all_xrefs:
-        if xref.xref_id not in all_section_ids:
-            broken_xrefs.append(xref)
+    print(f"Total xrefs found: {xref_count}")
 
     # Report results
     print("\n" + "="*80)
@@ -281,7 +476,7 @@ def main():
     print("="*80)
     print(f"Files analyzed: {len(adoc_files)}")
     print(f"Section IDs found: {len(all_section_ids)}")
-    print(f"Cross-references found: {len(all_xrefs)}")
+    print(f"Cross-references found: {xref_count}")
     print(f"Broken cross-references: {len(broken_xrefs)}")
 
     # Check for duplicate section IDs